@@ -0,0 +1,142 @@
+"""Import-time and setup-time benchmark for the Samsung Jet Bot integration.
+
+Run from the repository root in an environment with Home Assistant installed:
+
+    python benchmarks/startup.py --entries 50
+"""
+
+import argparse
+import asyncio
+import importlib
+import importlib.util
+import subprocess
+import sys
+import time
+from contextlib import ExitStack
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "custom_components.samsung_jetbot_combo"
+
+
+def measure_import(module: str, runs: int) -> float:
+    """Return the best cold import time of a module in a fresh interpreter (ms)."""
+    code = (
+        "import time, homeassistant.config_entries,"
+        " homeassistant.helpers.update_coordinator;"
+        f"t = time.perf_counter(); import {module};"
+        "print((time.perf_counter() - t) * 1000)"
+    )
+    timings = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        timings.append(float(out.stdout.strip()))
+    return min(timings)
+
+
+def _make_hass(platform_imports: dict[str, float | None]):
+    """Build a minimal hass stand-in with a loaded SmartThings entry."""
+    from homeassistant.config_entries import ConfigEntryState
+
+    hass = MagicMock()
+    hass.data = {}
+    hass.config.path = lambda *parts: str(Path("/tmp", *parts))
+    smartthings_entry = MagicMock(state=ConfigEntryState.LOADED)
+    hass.config_entries.async_get_entry.return_value = smartthings_entry
+
+    async def forward(entry, platforms):
+        # Platform modules are imported when forwarded, as Home Assistant does
+        for platform in platforms:
+            if platform in platform_imports:
+                continue
+            start = time.perf_counter()
+            try:
+                importlib.import_module(f"{PACKAGE}.{platform}")
+            except ImportError as err:
+                print(f"  platform {platform} not importable here: {err}")
+                platform_imports[platform] = None
+            else:
+                platform_imports[platform] = (time.perf_counter() - start) * 1000
+
+    hass.config_entries.async_forward_entry_setups = forward
+    return hass
+
+
+async def measure_setup(entries: int) -> tuple[float, float, dict]:
+    """Return (integration import ms, setup ms, platform import ms)."""
+    # Core modules are loaded by Home Assistant before any integration
+    importlib.import_module("homeassistant.config_entries")
+    importlib.import_module("homeassistant.helpers.update_coordinator")
+    start = time.perf_counter()
+    integration = importlib.import_module(PACKAGE)
+    import_ms = (time.perf_counter() - start) * 1000
+
+    platform_imports: dict[str, float | None] = {}
+    hass = _make_hass(platform_imports)
+    with ExitStack() as stack:
+        # No network: skip the first refresh and stored state loading
+        stack.enter_context(
+            patch.object(
+                integration.JetBotDataUpdateCoordinator,
+                "async_config_entry_first_refresh",
+                AsyncMock(),
+            )
+        )
+        if importlib.util.find_spec(f"{PACKAGE}.consumables"):
+            stack.enter_context(
+                patch(
+                    f"{PACKAGE}.consumables.JetBotConsumables.async_load",
+                    AsyncMock(),
+                )
+            )
+        start = time.perf_counter()
+        for index in range(entries):
+            entry = MagicMock(entry_id=f"entry_{index}")
+            entry.data = {
+                "device_id": f"device_{index}",
+                "smartthings_entry_id": "smartthings",
+            }
+            await integration.async_setup_entry(hass, entry)
+        setup_ms = (time.perf_counter() - start) * 1000
+    setup_ms -= sum(ms for ms in platform_imports.values() if ms)
+    return import_ms, setup_ms, platform_imports
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    from homeassistant.const import __version__ as ha_version
+
+    sys.path.insert(0, str(ROOT))
+    print(f"Home Assistant {ha_version}, Python {sys.version.split()[0]}")
+    print(f"cold import {PACKAGE}: {measure_import(PACKAGE, args.runs):.1f} ms")
+    print(
+        f"cold import {PACKAGE}.sensor: "
+        f"{measure_import(PACKAGE + '.sensor', args.runs):.1f} ms"
+    )
+
+    import_ms, setup_ms, platform_imports = asyncio.run(
+        measure_setup(args.entries)
+    )
+    print(f"in-process integration import: {import_ms:.1f} ms")
+    for platform, ms in platform_imports.items():
+        if ms is not None:
+            print(f"  platform {platform} import on first forward: {ms:.1f} ms")
+    print(
+        f"setup of {args.entries} entries (excluding platform imports): "
+        f"{setup_ms:.1f} ms ({setup_ms / args.entries:.2f} ms/entry)"
+    )
+
+
+if __name__ == "__main__":
+    main()
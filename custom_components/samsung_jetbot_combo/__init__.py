@@ -5,10 +5,12 @@ from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 
+from .consumables import async_remove_consumables_storage
 from .const import DOMAIN
-from .sensor import JetBotDataUpdateCoordinator
+from .coordinator import JetBotDataUpdateCoordinator
+from .map_cache import async_remove_map_storage
 
-PLATFORMS = ["sensor", "vacuum", "select"]
+PLATFORMS = ["sensor", "vacuum", "select", "image", "button", "binary_sensor"]
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,6 +28,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Initialize coordinator that will work with SmartThings entities
     coordinator = JetBotDataUpdateCoordinator(hass, device_id, smartthings_entry_id)
+    await coordinator.consumables.async_load()
     await coordinator.async_config_entry_first_refresh()
 
     # Store coordinator
@@ -46,4 +49,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
-    return unload_ok
\ No newline at end of file
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete data stored for a removed config entry."""
+    device_id = entry.data["device_id"]
+    await async_remove_map_storage(hass, device_id)
+    await async_remove_consumables_storage(hass, device_id)
@@ -0,0 +1,168 @@
+"""Stuck-robot and anomaly detection on the Samsung Jet Bot state stream."""
+
+import logging
+import time
+from collections import deque
+from typing import NamedTuple
+
+from .const import DOMAIN
+from .descriptors import capability_value, to_float
+
+_LOGGER = logging.getLogger(__name__)
+
+EVENT_ANOMALY = f"{DOMAIN}_anomaly"
+
+# Samples kept per device (~10 minutes at the 30 second poll interval)
+RING_SIZE = 20
+
+STALL_TIME = 15 * 60
+RETURN_TIMEOUT = 10 * 60
+MAX_CLEANING_TIME = 3 * 3600
+
+# A sample arriving this long after the previous one means polling was
+# interrupted, so progress tracking restarts from it
+MAX_SAMPLE_GAP = 5 * 60
+
+# Battery drop in %/hour considered abnormal while cleaning (a full charge
+# normally lasts 60-100 minutes), and absolute drop over the window
+# considered abnormal while docked
+MAX_DRAIN_RATE = 200
+MAX_DOCKED_DROP = 5
+MIN_DRAIN_WINDOW = 5 * 60
+
+PAUSE_LOOP_COUNT = 4
+PAUSE_LOOP_WINDOW = 30 * 60
+
+RETURNING_STATES = ("returning", "return_to_base", "returntohome")
+DOCKED_STATES = ("docked", "charging")
+
+ANOMALY_STALLED = "stalled"
+ANOMALY_CLEANING_TOO_LONG = "cleaning_too_long"
+ANOMALY_DOCK_NOT_FOUND = "dock_not_found"
+ANOMALY_BATTERY_DRAIN = "battery_drain"
+ANOMALY_PAUSE_LOOP = "pause_loop"
+
+
+class Sample(NamedTuple):
+    """A single observation of the robot."""
+
+    timestamp: float
+    state: str | None
+    cleaned_extent: float | None
+    battery: float | None
+
+
+class JetBotAnomalyDetector:
+    """Flags stalls, abnormal battery drain and pause/resume loops.
+
+    Each update does a constant amount of work against a fixed-size ring
+    buffer, so cost and memory per device stay bounded.
+    """
+
+    def __init__(self, hass, device_id: str):
+        self.hass = hass
+        self._device_id = device_id
+        self._samples: deque[Sample] = deque(maxlen=RING_SIZE)
+        self._pauses: deque[float] = deque(maxlen=PAUSE_LOOP_COUNT)
+        self._state_since = 0.0
+        self._extent_since = 0.0
+        self.active: dict[str, str] = {}
+
+    @property
+    def samples(self) -> tuple[Sample, ...]:
+        """Return the buffered samples, oldest first."""
+        return tuple(self._samples)
+
+    def process(self, components: dict, now: float | None = None) -> None:
+        """Add a sample from a polled status payload and re-evaluate."""
+        caps = components.get("main", {})
+        state = capability_value(
+            caps, "samsungce.robotCleanerOperatingState", "operatingState"
+        )
+        sample = Sample(
+            time.monotonic() if now is None else now,
+            str(state).lower() if state else None,
+            to_float(
+                capability_value(
+                    caps, "samsungce.robotCleanerMapCleaningInfo", "cleanedExtent"
+                )
+            ),
+            to_float(capability_value(caps, "battery", "battery")),
+        )
+
+        previous = self._samples[-1] if self._samples else None
+        if previous is None or previous.state != sample.state:
+            self._state_since = sample.timestamp
+            self._extent_since = sample.timestamp
+            if sample.state == "paused":
+                self._pauses.append(sample.timestamp)
+        elif sample.timestamp - previous.timestamp > MAX_SAMPLE_GAP:
+            self._extent_since = sample.timestamp
+        elif (
+            sample.cleaned_extent is not None
+            and previous.cleaned_extent is not None
+            and sample.cleaned_extent > previous.cleaned_extent
+        ):
+            self._extent_since = sample.timestamp
+        self._samples.append(sample)
+
+        self._evaluate(sample)
+
+    def _evaluate(self, sample: Sample) -> None:
+        found: dict[str, str] = {}
+        in_state = sample.timestamp - self._state_since
+
+        if sample.state == "cleaning":
+            stalled_for = sample.timestamp - self._extent_since
+            if sample.cleaned_extent is not None and stalled_for >= STALL_TIME:
+                found[ANOMALY_STALLED] = (
+                    f"Cleaned extent unchanged for {int(stalled_for // 60)} min"
+                )
+            if in_state >= MAX_CLEANING_TIME:
+                found[ANOMALY_CLEANING_TOO_LONG] = (
+                    f"Cleaning for {int(in_state // 60)} min"
+                )
+        elif sample.state in RETURNING_STATES and in_state >= RETURN_TIMEOUT:
+            found[ANOMALY_DOCK_NOT_FOUND] = f"Returning for {int(in_state // 60)} min"
+
+        oldest = self._samples[0]
+        window = sample.timestamp - oldest.timestamp
+        if (
+            window >= MIN_DRAIN_WINDOW
+            and oldest.battery is not None
+            and sample.battery is not None
+        ):
+            drop = oldest.battery - sample.battery
+            # Only rate a window spent entirely in the current state
+            whole_window = self._state_since <= oldest.timestamp
+            if sample.state in DOCKED_STATES and whole_window:
+                if drop > MAX_DOCKED_DROP:
+                    found[ANOMALY_BATTERY_DRAIN] = f"Lost {drop:g}% while docked"
+            elif (
+                sample.state == "cleaning"
+                and whole_window
+                and drop / window * 3600 > MAX_DRAIN_RATE
+            ):
+                found[ANOMALY_BATTERY_DRAIN] = (
+                    f"Draining at {drop / window * 3600:.0f}%/h"
+                )
+
+        if (
+            len(self._pauses) == PAUSE_LOOP_COUNT
+            and sample.timestamp - self._pauses[0] <= PAUSE_LOOP_WINDOW
+        ):
+            found[ANOMALY_PAUSE_LOOP] = (
+                f"Paused {PAUSE_LOOP_COUNT} times within "
+                f"{int(PAUSE_LOOP_WINDOW // 60)} min"
+            )
+
+        for anomaly, detail in found.items():
+            if anomaly not in self.active:
+                _LOGGER.warning(
+                    "Jet Bot %s anomaly %s: %s", self._device_id, anomaly, detail
+                )
+                self.hass.bus.async_fire(
+                    EVENT_ANOMALY,
+                    {"device_id": self._device_id, "type": anomaly, "detail": detail},
+                )
+        self.active = found
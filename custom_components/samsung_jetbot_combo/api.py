@@ -0,0 +1,76 @@
+"""SmartThings REST helpers shared by the Samsung Jet Bot platforms."""
+
+import logging
+
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import SMARTTHINGS_BASE_URL
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def get_smartthings_access_token(hass, smartthings_entry_id):
+    """Get the access token from the SmartThings integration."""
+    try:
+        # Get the SmartThings integration entry
+        smartthings_entry = hass.config_entries.async_get_entry(smartthings_entry_id)
+        if not smartthings_entry:
+            raise Exception("SmartThings entry not found")
+        
+        # Get the OAuth session from the SmartThings integration
+        if "smartthings" in hass.data and smartthings_entry_id in hass.data["smartthings"]:
+            smartthings_data = hass.data["smartthings"][smartthings_entry_id]
+            
+            # Try different ways to get the token depending on the integration structure
+            if hasattr(smartthings_data, 'api') and hasattr(smartthings_data.api, '_token'):
+                return smartthings_data.api._token
+            elif 'token' in smartthings_data:
+                return smartthings_data['token']
+            elif hasattr(smartthings_data, 'token'):
+                return smartthings_data.token
+        
+        # Fallback: try to get token from the entry data
+        if 'token' in smartthings_entry.data:
+            return smartthings_entry.data['token']['access_token']
+            
+        raise Exception("Could not extract access token from SmartThings integration")
+        
+    except Exception as err:
+        _LOGGER.error("Failed to get SmartThings access token: %s", err)
+        raise
+
+
+async def send_command(
+    hass,
+    smartthings_entry_id: str,
+    device_id: str,
+    command: str,
+    capability: str = "samsungce.robotCleanerOperatingState",
+    arguments: list | None = None,
+):
+    """Send a command to SmartThings using OAuth token (original method restored)."""
+    try:
+        access_token = await get_smartthings_access_token(hass, smartthings_entry_id)
+        session = async_get_clientsession(hass)
+        url = f"{SMARTTHINGS_BASE_URL}/{device_id}/commands"
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json",
+            "Accept": "application/vnd.smartthings+json;v=1",
+        }
+        payload_command = {
+            "component": "main",
+            "capability": capability,
+            "command": command,
+        }
+        if arguments is not None:
+            payload_command["arguments"] = arguments
+        payload = {"commands": [payload_command]}
+        resp = await session.post(url, json=payload, headers=headers)
+        resp.raise_for_status()
+        await resp.release()
+        _LOGGER.debug("Successfully sent command %s to device %s", command, device_id)
+        
+    except Exception as err:
+        _LOGGER.error("Failed to send command %s to device %s: %s", command, device_id, err)
+        raise
@@ -0,0 +1,42 @@
+"""Binary sensor platform flagging Samsung Jet Bot anomalies."""
+
+import logging
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(hass, entry, async_add_entities):
+    """Set up the anomaly binary sensor."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    device_id = entry.data["device_id"]
+
+    async_add_entities([JetBotAnomalySensor(coordinator, device_id)])
+
+
+class JetBotAnomalySensor(CoordinatorEntity, BinarySensorEntity):
+    """On while the robot looks stuck or otherwise misbehaves."""
+
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+
+    def __init__(self, coordinator, device_id: str):
+        super().__init__(coordinator)
+        self._attr_name = "Jet Bot Problem"
+        self._attr_unique_id = f"{DOMAIN}_{device_id}_anomaly"
+
+    @property
+    def is_on(self) -> bool:
+        """Return True if any anomaly is currently active."""
+        return bool(self.coordinator.anomalies.active)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Expose the active anomalies and their details."""
+        return {"anomalies": dict(self.coordinator.anomalies.active)}
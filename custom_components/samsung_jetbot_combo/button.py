@@ -0,0 +1,39 @@
+"""Button platform to reset Samsung Jet Bot consumable counters."""
+
+import logging
+
+from homeassistant.components.button import ButtonEntity
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .consumables import CONSUMABLES, Consumable
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(hass, entry, async_add_entities):
+    """Set up consumable reset buttons."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    device_id = entry.data["device_id"]
+
+    async_add_entities(
+        JetBotConsumableResetButton(coordinator, device_id, consumable)
+        for consumable in CONSUMABLES
+    )
+
+
+class JetBotConsumableResetButton(CoordinatorEntity, ButtonEntity):
+    """Reset the wear counter of a consumable after replacing it."""
+
+    def __init__(self, coordinator, device_id: str, consumable: Consumable):
+        super().__init__(coordinator)
+        self._consumable = consumable
+        self._attr_name = f"Reset {consumable.name}"
+        self._attr_unique_id = f"{DOMAIN}_{device_id}_{consumable.key}_reset"
+        self._attr_icon = "mdi:restore"
+
+    async def async_press(self) -> None:
+        """Reset the counter and refresh dependent sensors."""
+        _LOGGER.debug("Resetting consumable %s", self._consumable.key)
+        self.coordinator.consumables.reset(self._consumable.key)
+        self.coordinator.async_update_listeners()
@@ -2,3 +2,6 @@
 
 DOMAIN = "samsung_jetbot_combo"
 SMARTTHINGS_BASE_URL = "https://api.smartthings.com/v1/devices"
+
+MAP_STORAGE_DIR = f"{DOMAIN}_maps"
+MAP_CACHE_SIZE = 4
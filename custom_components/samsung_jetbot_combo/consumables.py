@@ -0,0 +1,153 @@
+"""Consumable wear estimation for Samsung Jet Bot based on cleaning runtime."""
+
+import logging
+import time
+from dataclasses import dataclass
+
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .descriptors import (
+    CLEANING_TYPE_MOP,
+    CLEANING_TYPE_MOP_AFTER_VACUUM,
+    CLEANING_TYPE_TOGETHER,
+    CLEANING_TYPE_VACUUM,
+    capability_value,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# Counters are written at most this often while cleaning, and once per run end
+SAVE_INTERVAL = 300
+
+# Longest gap between two samples still counted as continuous cleaning
+MAX_SAMPLE_GAP = 300
+
+VACUUM = "vacuum"
+MOP = "mop"
+
+# Share of the elapsed time each tool is worn for, per cleaning type.
+# mopAfterVacuum vacuums first and mops afterwards; when cleaningStep does
+# not say which phase is running, each tool is charged half the time.
+CLEANING_TYPE_USAGE = {
+    CLEANING_TYPE_VACUUM: {VACUUM: 1.0},
+    CLEANING_TYPE_MOP: {MOP: 1.0},
+    CLEANING_TYPE_TOGETHER: {VACUUM: 1.0, MOP: 1.0},
+    CLEANING_TYPE_MOP_AFTER_VACUUM: {VACUUM: 0.5, MOP: 0.5},
+}
+
+# cleaningStep keywords identifying the active phase of a mopAfterVacuum run
+STEP_KEYWORDS = {
+    MOP: ("mop", "wet"),
+    VACUUM: ("vacuum", "dry", "suction"),
+}
+
+
+def _usage(cleaning_type, cleaning_step) -> dict[str, float]:
+    """Return the share of time each tool is worn for the current sample."""
+    usage = CLEANING_TYPE_USAGE.get(cleaning_type, {VACUUM: 1.0})
+    if cleaning_type == CLEANING_TYPE_MOP_AFTER_VACUUM and cleaning_step:
+        step = str(cleaning_step).lower()
+        for tool, keywords in STEP_KEYWORDS.items():
+            if any(keyword in step for keyword in keywords):
+                return {tool: 1.0}
+    return usage
+
+
+@dataclass(frozen=True)
+class Consumable:
+    """A wearable part and its rated life in cleaning hours."""
+
+    key: str
+    name: str
+    usage: str
+    life_hours: float
+    icon: str
+
+
+CONSUMABLES = (
+    Consumable("main_brush", "Main Brush", VACUUM, 300, "mdi:brush"),
+    Consumable("side_brush", "Side Brush", VACUUM, 200, "mdi:brush-variant"),
+    Consumable("filter", "Filter", VACUUM, 150, "mdi:air-filter"),
+    Consumable("dust_bag", "Dust Bag", VACUUM, 60, "mdi:delete-variant"),
+    Consumable("mop_pad", "Mop Pad", MOP, 100, "mdi:spray-bottle"),
+)
+
+
+class JetBotConsumables:
+    """Accumulates per-consumable runtime from coordinator state samples.
+
+    Only data the coordinator already polls is used; counters are written
+    every ``SAVE_INTERVAL`` seconds during a run and once when it ends.
+    """
+
+    def __init__(self, hass, device_id: str):
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}_consumables_{device_id}")
+        self._runtime: dict[str, float] = {item.key: 0.0 for item in CONSUMABLES}
+        self._last_sample: float | None = None
+        self._last_usage: dict[str, float] = {}
+        self._last_save = 0.0
+
+    async def async_load(self) -> None:
+        """Restore counters from storage."""
+        data = await self._store.async_load()
+        if data:
+            for key, seconds in data.get("runtime", {}).items():
+                if key in self._runtime:
+                    self._runtime[key] = float(seconds)
+
+    def _data_to_save(self) -> dict:
+        return {"runtime": dict(self._runtime)}
+
+    def process(self, components: dict) -> None:
+        """Account the time since the previous sample to the active tools."""
+        caps = components.get("main", {})
+        now = time.monotonic()
+
+        counted = bool(self._last_usage) and self._last_sample is not None
+        if counted:
+            elapsed = min(now - self._last_sample, MAX_SAMPLE_GAP)
+            for item in CONSUMABLES:
+                if item.usage in self._last_usage:
+                    self._runtime[item.key] += elapsed * self._last_usage[item.usage]
+
+        state = capability_value(
+            caps, "samsungce.robotCleanerOperatingState", "operatingState"
+        )
+        if str(state).lower() == "cleaning":
+            cleaning_type = capability_value(
+                caps, "samsungce.robotCleanerCleaningType", "cleaningType"
+            )
+            cleaning_step = capability_value(
+                caps, "samsungce.robotCleanerOperatingState", "cleaningStep"
+            )
+            self._last_usage = _usage(cleaning_type, cleaning_step)
+        else:
+            self._last_usage = {}
+        self._last_sample = now
+
+        if counted and (not self._last_usage or now - self._last_save >= SAVE_INTERVAL):
+            self._store.async_delay_save(self._data_to_save)
+            self._last_save = now
+
+    def hours_used(self, key: str) -> float:
+        """Return accumulated cleaning hours for a consumable."""
+        return self._runtime[key] / 3600
+
+    def remaining(self, consumable: Consumable) -> float:
+        """Return the estimated remaining life in percent."""
+        used = self.hours_used(consumable.key) / consumable.life_hours
+        return round(max(0.0, 1.0 - used) * 100, 1)
+
+    def reset(self, key: str) -> None:
+        """Reset a consumable after it has been replaced."""
+        self._runtime[key] = 0.0
+        self._store.async_delay_save(self._data_to_save)
+
+
+async def async_remove_consumables_storage(hass, device_id: str) -> None:
+    """Delete the stored counters of a device."""
+    store = Store(hass, STORAGE_VERSION, f"{DOMAIN}_consumables_{device_id}")
+    await store.async_remove()
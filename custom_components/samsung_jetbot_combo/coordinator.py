@@ -0,0 +1,78 @@
+"""Data update coordinator for Samsung Jet Bot using OAuth tokens."""
+
+import logging
+from datetime import timedelta
+
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+
+from .anomaly import JetBotAnomalyDetector
+from .api import get_smartthings_access_token
+from .const import DOMAIN, SMARTTHINGS_BASE_URL
+from .consumables import JetBotConsumables
+from .executor import JetBotCommandExecutor
+from .map_cache import JetBotMapCache
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class JetBotDataUpdateCoordinator(DataUpdateCoordinator):
+    """Coordinator to fetch SmartThings device data using OAuth tokens (original method restored)."""
+
+    def __init__(self, hass, device_id: str, smartthings_entry_id: str):
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_{device_id}",
+            update_interval=timedelta(seconds=30),
+        )
+        self._device_id = device_id
+        self._smartthings_entry_id = smartthings_entry_id
+        self.maps = JetBotMapCache(hass, device_id)
+        self.consumables = JetBotConsumables(hass, device_id)
+        self.anomalies = JetBotAnomalyDetector(hass, device_id)
+        self.commands = JetBotCommandExecutor(hass, smartthings_entry_id, device_id)
+
+    async def _async_update_data(self):
+        """Fetch latest status and device detail from SmartThings (original method restored)."""
+        try:
+            access_token = await get_smartthings_access_token(self.hass, self._smartthings_entry_id)
+            session = async_get_clientsession(self.hass)
+            headers = {"Authorization": f"Bearer {access_token}"}
+
+            # 1) Get device status (all components/attributes)
+            status_url = f"{SMARTTHINGS_BASE_URL}/{self._device_id}/status"
+            resp = await session.get(status_url, headers=headers)
+            resp.raise_for_status()
+            status_json = await resp.json()
+            await resp.release()
+
+            # 2) Get device details (for the label)
+            detail_url = f"{SMARTTHINGS_BASE_URL}/{self._device_id}"
+            resp = await session.get(detail_url, headers=headers)
+            resp.raise_for_status()
+            detail_json = await resp.json()
+            await resp.release()
+
+            components = status_json.get("components", {})
+
+            # 3) Map and room metadata, only refetched when the map version changes
+            await self.maps.async_update(components, session, headers)
+
+            # 4) Consumable wear, derived from the status we already have
+            self.consumables.process(components)
+
+            # 5) Stuck-robot and anomaly detection on the same sample
+            self.anomalies.process(components)
+
+            return {
+                "components": components,
+                "label": detail_json.get("label"),
+            }
+            
+        except Exception as err:
+            _LOGGER.error("Error updating data for device %s: %s", self._device_id, err)
+            raise UpdateFailed(f"Error communicating with SmartThings API: {err}") from err
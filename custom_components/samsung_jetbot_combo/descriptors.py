@@ -0,0 +1,137 @@
+"""Attribute descriptors for Samsung Jet Bot, built once and shared by platforms."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class JetBotAttribute:
+    """A SmartThings attribute exposed as a sensor and on the vacuum card."""
+
+    key: str
+    name: str
+    capability: str
+    value_key: str
+    attribute: str
+    component: str = "main"
+    unit_of_measurement: str | None = None
+    icon: str | None = None
+
+
+ATTRIBUTES = (
+    JetBotAttribute(
+        key="battery",
+        name="Jet Bot Battery",
+        capability="battery",
+        value_key="battery",
+        attribute="battery_level",
+        unit_of_measurement="%",
+        icon="mdi:battery",
+    ),
+    JetBotAttribute(
+        key="mode",
+        name="Cleaning Mode",
+        capability="samsungce.robotCleanerCleaningMode",
+        value_key="robotCleanerCleaningMode",
+        attribute="cleaning_mode",
+    ),
+    JetBotAttribute(
+        key="state",
+        name="Operating State",
+        capability="samsungce.robotCleanerOperatingState",
+        value_key="operatingState",
+        attribute="operating_state",
+    ),
+    JetBotAttribute(
+        key="step",
+        name="Cleaning Step",
+        capability="samsungce.robotCleanerOperatingState",
+        value_key="cleaningStep",
+        attribute="cleaning_step",
+    ),
+    JetBotAttribute(
+        key="dustbin",
+        name="Dustbin Status",
+        capability="samsungce.robotCleanerDustBag",
+        value_key="status",
+        attribute="dustbin_status",
+        component="station",
+    ),
+    JetBotAttribute(
+        key="spray",
+        name="Water Spray Level",
+        capability="samsungce.robotCleanerWaterSprayLevel",
+        value_key="waterSprayLevel",
+        attribute="water_spray_level",
+    ),
+    JetBotAttribute(
+        key="turbo",
+        name="Turbo Mode",
+        capability="samsungce.robotCleanerTurboMode",
+        value_key="robotCleanerTurboMode",
+        attribute="turbo_mode",
+    ),
+    JetBotAttribute(
+        key="sound",
+        name="Sound Mode",
+        capability="samsungce.robotCleanerSystemSoundMode",
+        value_key="soundMode",
+        attribute="sound_mode",
+    ),
+    JetBotAttribute(
+        key="map_area",
+        name="Map Area",
+        capability="samsungce.robotCleanerMapCleaningInfo",
+        value_key="area",
+        attribute="map_area",
+    ),
+    JetBotAttribute(
+        key="extent",
+        name="Cleaned Extent",
+        capability="samsungce.robotCleanerMapCleaningInfo",
+        value_key="cleanedExtent",
+        attribute="cleaned_extent",
+    ),
+)
+
+# Raw cleaning type values and their user-friendly names
+CLEANING_TYPE_VACUUM = "vacuum"
+CLEANING_TYPE_MOP = "mop"
+CLEANING_TYPE_TOGETHER = "vacuumAndMopTogether"
+CLEANING_TYPE_MOP_AFTER_VACUUM = "mopAfterVacuum"
+
+CLEANING_TYPES = {
+    CLEANING_TYPE_VACUUM: "Vacuum Only",
+    CLEANING_TYPE_MOP: "Mop Only",
+    CLEANING_TYPE_TOGETHER: "Vacuum & Mop Together",
+    CLEANING_TYPE_MOP_AFTER_VACUUM: "Vacuum Then Mop",
+}
+CLEANING_TYPES_BY_NAME = {name: raw for raw, name in CLEANING_TYPES.items()}
+
+
+def capability_attribute(caps: dict, capability: str, key: str) -> dict:
+    """Return a raw SmartThings attribute (value plus timestamp) as a dict."""
+    raw = caps.get(capability, {}).get(key)
+    if isinstance(raw, dict):
+        return raw
+    return {"value": raw}
+
+
+def capability_value(caps: dict, capability: str, key: str):
+    """Return the unwrapped value of a SmartThings attribute."""
+    return capability_attribute(caps, capability, key).get("value")
+
+
+def to_float(value) -> float | None:
+    """Convert an attribute value to float, or None if it is not numeric."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def attribute_value(data: dict, attribute: JetBotAttribute):
+    """Extract an attribute value from coordinator data."""
+    comps = data.get("components", {})
+    return capability_value(
+        comps.get(attribute.component, {}), attribute.capability, attribute.value_key
+    )
@@ -0,0 +1,134 @@
+"""Per-device command executor for Samsung Jet Bot."""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from collections.abc import Callable
+
+from homeassistant.core import callback
+
+from .api import send_command
+
+_LOGGER = logging.getLogger(__name__)
+
+COMMAND_TIMEOUT = 15
+
+# Capabilities whose commands must reach the robot in the order they were
+# issued, e.g. a cleaning type change followed by start
+CONFLICT_GROUPS = {
+    "samsungce.robotCleanerOperatingState": "operation",
+    "samsungce.robotCleanerCleaningType": "operation",
+}
+
+
+class JetBotCommandExecutor:
+    """Serialises conflicting commands for one device.
+
+    Capabilities in the same ``CONFLICT_GROUPS`` group conflict: their
+    commands are sent one at a time, in the order they were issued. Any
+    other capability forms a group of its own, so independent settings are
+    sent in parallel.
+
+    Supersession is per capability: a command still waiting for its turn is
+    dropped when a newer command on the same capability arrives (``stop``
+    drops a queued ``start``), but a new cleaning type never drops a queued
+    operating-state command or the other way round.
+    """
+
+    def __init__(
+        self,
+        hass,
+        smartthings_entry_id: str,
+        device_id: str,
+        timeout: float = COMMAND_TIMEOUT,
+    ):
+        self.hass = hass
+        self._smartthings_entry_id = smartthings_entry_id
+        self._device_id = device_id
+        self._timeout = timeout
+        self._locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._generation: defaultdict[str, int] = defaultdict(int)
+        self._listeners: list[Callable[[], None]] = []
+
+        self.queue_depth = 0
+        self.last_wait = 0.0
+        self.max_wait = 0.0
+        self.sent = 0
+        self.superseded = 0
+        self.last_superseded: str | None = None
+        self.timeouts = 0
+        self._total_wait = 0.0
+
+    @property
+    def average_wait(self) -> float:
+        """Return the average time commands waited for their turn."""
+        return self._total_wait / self.sent if self.sent else 0.0
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]):
+        """Listen for metric changes; returns a function to stop listening."""
+        self._listeners.append(update_callback)
+        return lambda: self._listeners.remove(update_callback)
+
+    @callback
+    def _notify(self) -> None:
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    async def async_send(
+        self,
+        command: str,
+        capability: str = "samsungce.robotCleanerOperatingState",
+        arguments: list | None = None,
+    ) -> bool:
+        """Send a command; return False if a newer command made it obsolete."""
+        self._generation[capability] += 1
+        generation = self._generation[capability]
+        queued_at = time.monotonic()
+        self.queue_depth += 1
+        self._notify()
+        try:
+            # asyncio.Lock wakes waiters first in, first out
+            group = CONFLICT_GROUPS.get(capability, capability)
+            async with self._locks[group]:
+                if generation != self._generation[capability]:
+                    _LOGGER.info(
+                        "Dropping command %s for device %s, superseded by a newer "
+                        "%s command",
+                        command,
+                        self._device_id,
+                        capability,
+                    )
+                    self.superseded += 1
+                    self.last_superseded = command
+                    return False
+
+                wait = time.monotonic() - queued_at
+                self.last_wait = wait
+                self.max_wait = max(self.max_wait, wait)
+                self._total_wait += wait
+                self.sent += 1
+                try:
+                    async with asyncio.timeout(self._timeout):
+                        await send_command(
+                            self.hass,
+                            self._smartthings_entry_id,
+                            self._device_id,
+                            command,
+                            capability=capability,
+                            arguments=arguments,
+                        )
+                except TimeoutError:
+                    self.timeouts += 1
+                    _LOGGER.error(
+                        "Command %s to device %s timed out after %ss",
+                        command,
+                        self._device_id,
+                        self._timeout,
+                    )
+                    raise
+                return True
+        finally:
+            self.queue_depth -= 1
+            self._notify()
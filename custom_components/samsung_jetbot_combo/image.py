@@ -0,0 +1,56 @@
+"""Image platform showing the last run's coverage for Samsung Jet Bot."""
+
+import logging
+from datetime import datetime, timezone
+
+from homeassistant.components.image import ImageEntity
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .map_cache import render_coverage_svg
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(hass, entry, async_add_entities):
+    """Set up the coverage image for Samsung Jet Bot."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    device_id = entry.data["device_id"]
+
+    async_add_entities([JetBotCoverageImage(hass, coordinator, device_id)])
+
+
+class JetBotCoverageImage(CoordinatorEntity, ImageEntity):
+    """Coverage summary of the last run (percentage and rooms, no map geometry)."""
+
+    _attr_content_type = "image/svg+xml"
+
+    def __init__(self, hass, coordinator, device_id: str):
+        CoordinatorEntity.__init__(self, coordinator)
+        ImageEntity.__init__(self, hass)
+        self._attr_name = "Last Run Coverage Image"
+        self._attr_unique_id = f"{DOMAIN}_{device_id}_coverage_image"
+        self._last_run_end = None
+        self._update_timestamp()
+
+    def _update_timestamp(self) -> None:
+        jetbot_map = self.coordinator.maps.current
+        last_run_end = jetbot_map.last_run_end if jetbot_map else None
+        if last_run_end != self._last_run_end or self._attr_image_last_updated is None:
+            self._last_run_end = last_run_end
+            self._attr_image_last_updated = (
+                datetime.fromtimestamp(last_run_end, timezone.utc)
+                if last_run_end
+                else datetime.now(timezone.utc)
+            )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Only bump the image timestamp when a new run has been recorded."""
+        self._update_timestamp()
+        super()._handle_coordinator_update()
+
+    async def async_image(self) -> bytes | None:
+        """Return the rendered coverage image."""
+        return render_coverage_svg(self.coordinator.maps.current)
@@ -0,0 +1,331 @@
+"""Map and room data cache for Samsung Jet Bot backed by compact binary files."""
+
+import logging
+import os
+import shutil
+import struct
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from .const import (
+    MAP_CACHE_SIZE,
+    MAP_STORAGE_DIR,
+    SMARTTHINGS_BASE_URL,
+)
+from .descriptors import capability_attribute, capability_value, to_float
+
+_LOGGER = logging.getLogger(__name__)
+
+MAP_LIST_CAPABILITY = "samsungce.robotCleanerMapList"
+MAP_AREA_CAPABILITY = "samsungce.robotCleanerMapAreaInfo"
+MAP_CLEANING_CAPABILITY = "samsungce.robotCleanerMapCleaningInfo"
+
+RUNNING_STATES = ("cleaning", "paused")
+
+# Seconds before a map version that failed to load is fetched again
+MAP_RETRY_INTERVAL = 3600
+
+# File layout: magic, format version, room count, then length-prefixed strings
+_MAGIC = b"JBMP"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sBH")
+_COVERAGE = struct.Struct("<ddd")
+_STR_LEN = struct.Struct("<H")
+
+
+@dataclass
+class JetBotRoom:
+    """A room (area) on a Jet Bot map."""
+
+    room_id: str
+    name: str
+
+
+@dataclass
+class JetBotMap:
+    """Map metadata plus coverage of the last finished run on that map."""
+
+    map_id: str
+    version: str
+    name: str = ""
+    rooms: list[JetBotRoom] = field(default_factory=list)
+    area: float = 0.0
+    cleaned_extent: float = 0.0
+    last_run_end: float = 0.0
+
+    @property
+    def coverage(self) -> float | None:
+        """Return the percentage of the map covered during the last run."""
+        if self.area <= 0 or not self.last_run_end:
+            return None
+        return round(min(self.cleaned_extent / self.area, 1.0) * 100, 1)
+
+
+def _pack_str(value: str) -> bytes:
+    raw = value.encode("utf-8")
+    if len(raw) > 0xFFFF:
+        # Cut back to a whole character so the stored string still decodes
+        raw = raw[:0xFFFF].decode("utf-8", "ignore").encode("utf-8")
+    return _STR_LEN.pack(len(raw)) + raw
+
+
+def _unpack_str(buf: bytes, offset: int) -> tuple[str, int]:
+    (length,) = _STR_LEN.unpack_from(buf, offset)
+    offset += _STR_LEN.size
+    return buf[offset : offset + length].decode("utf-8"), offset + length
+
+
+def encode_map(jetbot_map: JetBotMap) -> bytes:
+    """Serialise a map into the compact binary storage format."""
+    parts = [
+        _HEADER.pack(_MAGIC, _FORMAT_VERSION, len(jetbot_map.rooms)),
+        _pack_str(jetbot_map.map_id),
+        _pack_str(jetbot_map.version),
+        _pack_str(jetbot_map.name),
+        _COVERAGE.pack(
+            jetbot_map.area, jetbot_map.cleaned_extent, jetbot_map.last_run_end
+        ),
+    ]
+    for room in jetbot_map.rooms:
+        parts.append(_pack_str(room.room_id))
+        parts.append(_pack_str(room.name))
+    return b"".join(parts)
+
+
+def decode_map(buf: bytes) -> JetBotMap:
+    """Deserialise a map from the compact binary storage format."""
+    magic, fmt, room_count = _HEADER.unpack_from(buf, 0)
+    if magic != _MAGIC or fmt != _FORMAT_VERSION:
+        raise ValueError("Unsupported map file format")
+    offset = _HEADER.size
+    map_id, offset = _unpack_str(buf, offset)
+    version, offset = _unpack_str(buf, offset)
+    name, offset = _unpack_str(buf, offset)
+    area, extent, last_run_end = _COVERAGE.unpack_from(buf, offset)
+    offset += _COVERAGE.size
+    rooms = []
+    for _ in range(room_count):
+        room_id, offset = _unpack_str(buf, offset)
+        room_name, offset = _unpack_str(buf, offset)
+        rooms.append(JetBotRoom(room_id, room_name))
+    return JetBotMap(map_id, version, name, rooms, area, extent, last_run_end)
+
+
+def _parse_rooms(areas) -> list[JetBotRoom]:
+    rooms = []
+    for area in areas if isinstance(areas, list) else []:
+        if isinstance(area, dict):
+            room_id = str(area.get("id", area.get("areaId", len(rooms))))
+            rooms.append(JetBotRoom(room_id, str(area.get("name", room_id))))
+        else:
+            rooms.append(JetBotRoom(str(area), str(area)))
+    return rooms
+
+
+class JetBotMapCache:
+    """Per-device map cache refetched only when the reported map version changes.
+
+    Maps are stored one file per map under ``.storage`` and read back on first
+    access; at most ``MAP_CACHE_SIZE`` maps are kept in memory.
+    """
+
+    def __init__(self, hass, device_id: str, max_maps: int = MAP_CACHE_SIZE):
+        self.hass = hass
+        self._device_id = device_id
+        self._max_maps = max_maps
+        self._maps: OrderedDict[str, JetBotMap] = OrderedDict()
+        self._missing: set[str] = set()
+        self._current_map_id: str | None = None
+        self._last_state: str | None = None
+        self._failed_version: str | None = None
+        self._retry_at = 0.0
+        self._path = hass.config.path(".storage", MAP_STORAGE_DIR, device_id)
+
+    @property
+    def current(self) -> JetBotMap | None:
+        """Return the in-memory data for the map the robot is currently using."""
+        if self._current_map_id is None:
+            return None
+        return self._maps.get(self._current_map_id)
+
+    def _file(self, map_id: str) -> str:
+        safe_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in map_id)
+        return os.path.join(self._path, f"{safe_id}.bin")
+
+    def _read(self, map_id: str) -> JetBotMap | None:
+        try:
+            with open(self._file(map_id), "rb") as file:
+                return decode_map(file.read())
+        except FileNotFoundError:
+            return None
+        except (ValueError, struct.error, UnicodeDecodeError) as err:
+            _LOGGER.warning("Discarding unreadable map file for %s: %s", map_id, err)
+            return None
+        except OSError as err:
+            # Treat like a missing file; a storage problem must not fail polling
+            _LOGGER.warning("Failed to read map file for %s: %s", map_id, err)
+            return None
+
+    def _write(self, jetbot_map: JetBotMap) -> None:
+        os.makedirs(self._path, exist_ok=True)
+        target = self._file(jetbot_map.map_id)
+        tmp = f"{target}.tmp"
+        with open(tmp, "wb") as file:
+            file.write(encode_map(jetbot_map))
+        os.replace(tmp, target)
+
+    def _remember(self, jetbot_map: JetBotMap) -> None:
+        self._maps[jetbot_map.map_id] = jetbot_map
+        self._maps.move_to_end(jetbot_map.map_id)
+        while len(self._maps) > self._max_maps:
+            self._maps.popitem(last=False)
+
+    async def async_get(self, map_id: str) -> JetBotMap | None:
+        """Return a map, loading it from disk on first access."""
+        if map_id in self._maps:
+            self._maps.move_to_end(map_id)
+            return self._maps[map_id]
+        if map_id in self._missing:
+            return None
+        jetbot_map = await self.hass.async_add_executor_job(self._read, map_id)
+        if jetbot_map is None:
+            self._missing.add(map_id)
+        else:
+            self._remember(jetbot_map)
+        return jetbot_map
+
+    async def _async_save(self, jetbot_map: JetBotMap) -> None:
+        self._missing.discard(jetbot_map.map_id)
+        self._remember(jetbot_map)
+        try:
+            await self.hass.async_add_executor_job(self._write, jetbot_map)
+        except OSError as err:
+            # Keep serving the in-memory copy; a storage problem must not fail polling
+            _LOGGER.warning(
+                "Failed to store map data for device %s: %s", self._device_id, err
+            )
+
+    async def _async_fetch_areas(self, session, headers):
+        """Fetch room metadata for models that omit it from the full status."""
+        url = (
+            f"{SMARTTHINGS_BASE_URL}/{self._device_id}"
+            f"/components/main/capabilities/{MAP_AREA_CAPABILITY}/status"
+        )
+        resp = await session.get(url, headers=headers)
+        if resp.status == 404:
+            await resp.release()
+            return None
+        resp.raise_for_status()
+        status = await resp.json()
+        await resp.release()
+        return capability_value(
+            {MAP_AREA_CAPABILITY: status}, MAP_AREA_CAPABILITY, "areaInfo"
+        )
+
+    async def _async_build_map(
+        self, caps: dict, session, headers, map_id: str, version: str
+    ) -> JetBotMap:
+        """Build map metadata from the polled status, fetching rooms if missing."""
+        name = ""
+        areas = capability_value(caps, MAP_AREA_CAPABILITY, "areaInfo")
+        maps = capability_value(caps, MAP_LIST_CAPABILITY, "maps")
+        for entry in maps if isinstance(maps, list) else []:
+            if isinstance(entry, dict) and str(entry.get("id")) == map_id:
+                name = str(entry.get("name", ""))
+                if areas is None:
+                    areas = entry.get("areas")
+        if areas is None:
+            areas = await self._async_fetch_areas(session, headers)
+        return JetBotMap(map_id, version, name, _parse_rooms(areas))
+
+    async def async_update(self, components: dict, session, headers: dict) -> None:
+        """Refresh cached map data from a polled status payload.
+
+        Map metadata is only rebuilt when the map version reported in the
+        status payload differs from the cached one. A version that failed to
+        load is not retried before ``MAP_RETRY_INTERVAL`` has passed.
+        """
+        caps = components.get("main", {})
+        maps_attr = capability_attribute(caps, MAP_LIST_CAPABILITY, "maps")
+        maps = maps_attr.get("value")
+        if isinstance(maps, list) and maps and isinstance(maps[0], dict):
+            map_id = str(maps[0].get("id", "default"))
+        else:
+            map_id = "default"
+        areas_attr = capability_attribute(caps, MAP_AREA_CAPABILITY, "areaInfo")
+        version = str(maps_attr.get("timestamp") or areas_attr.get("timestamp") or "")
+        self._current_map_id = map_id
+
+        cached = await self.async_get(map_id)
+        stale = version and (cached is None or cached.version != version)
+        if stale and self._failed_version == version:
+            stale = time.monotonic() >= self._retry_at
+        if stale:
+            try:
+                fresh = await self._async_build_map(
+                    caps, session, headers, map_id, version
+                )
+            except Exception as err:
+                self._failed_version = version
+                self._retry_at = time.monotonic() + MAP_RETRY_INTERVAL
+                _LOGGER.warning(
+                    "Failed to fetch map data for device %s: %s", self._device_id, err
+                )
+            else:
+                self._failed_version = None
+                if cached is not None:
+                    fresh.area = cached.area
+                    fresh.cleaned_extent = cached.cleaned_extent
+                    fresh.last_run_end = cached.last_run_end
+                await self._async_save(fresh)
+                cached = fresh
+
+        await self._async_track_run(caps, map_id, cached)
+
+    async def _async_track_run(self, caps: dict, map_id: str, cached) -> None:
+        """Store coverage of a run once the robot stops cleaning."""
+        state = capability_value(
+            caps, "samsungce.robotCleanerOperatingState", "operatingState"
+        )
+        state = str(state).lower() if state else None
+        finished = self._last_state in RUNNING_STATES and state not in RUNNING_STATES
+        self._last_state = state
+        if not finished:
+            return
+
+        jetbot_map = cached or JetBotMap(map_id, "")
+        jetbot_map.area = (
+            to_float(capability_value(caps, MAP_CLEANING_CAPABILITY, "area")) or 0.0
+        )
+        jetbot_map.cleaned_extent = (
+            to_float(capability_value(caps, MAP_CLEANING_CAPABILITY, "cleanedExtent"))
+            or 0.0
+        )
+        jetbot_map.last_run_end = time.time()
+        await self._async_save(jetbot_map)
+
+
+async def async_remove_map_storage(hass, device_id: str) -> None:
+    """Delete all stored maps of a device."""
+    path = hass.config.path(".storage", MAP_STORAGE_DIR, device_id)
+    await hass.async_add_executor_job(shutil.rmtree, path, True)
+
+
+def render_coverage_svg(jetbot_map: JetBotMap | None) -> bytes:
+    """Render the last run's coverage as a small SVG image."""
+    width, height = 320, 200
+    coverage = jetbot_map.coverage if jetbot_map else None
+    fill = 0 if coverage is None else int(width * coverage / 100)
+    label = "No run recorded" if coverage is None else f"{coverage}% covered"
+    rooms = ", ".join(room.name for room in jetbot_map.rooms) if jetbot_map else ""
+    rooms = rooms.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    svg = (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}">'
+        f'<rect width="{width}" height="{height}" fill="#eceff1"/>'
+        f'<rect width="{fill}" height="{height}" fill="#4caf50"/>'
+        f'<text x="10" y="30" font-family="sans-serif" font-size="18">{label}</text>'
+        f'<text x="10" y="{height - 15}" font-family="sans-serif" font-size="12">'
+        f"{rooms}</text></svg>"
+    )
+    return svg.encode("utf-8")
@@ -3,81 +3,14 @@
 import logging
 
 from homeassistant.components.select import SelectEntity
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, SMARTTHINGS_BASE_URL
+from .const import DOMAIN
+from .descriptors import CLEANING_TYPES, CLEANING_TYPES_BY_NAME
 
 _LOGGER = logging.getLogger(__name__)
 
 
-async def get_smartthings_access_token(hass, smartthings_entry_id):
-    """Get the access token from the SmartThings integration."""
-    try:
-        # Get the SmartThings integration entry
-        smartthings_entry = hass.config_entries.async_get_entry(smartthings_entry_id)
-        if not smartthings_entry:
-            raise Exception("SmartThings entry not found")
-        
-        # Get the OAuth session from the SmartThings integration
-        if "smartthings" in hass.data and smartthings_entry_id in hass.data["smartthings"]:
-            smartthings_data = hass.data["smartthings"][smartthings_entry_id]
-            
-            # Try different ways to get the token depending on the integration structure
-            if hasattr(smartthings_data, 'api') and hasattr(smartthings_data.api, '_token'):
-                return smartthings_data.api._token
-            elif 'token' in smartthings_data:
-                return smartthings_data['token']
-            elif hasattr(smartthings_data, 'token'):
-                return smartthings_data.token
-        
-        # Fallback: try to get token from the entry data
-        if 'token' in smartthings_entry.data:
-            return smartthings_entry.data['token']['access_token']
-            
-        raise Exception("Could not extract access token from SmartThings integration")
-        
-    except Exception as err:
-        _LOGGER.error("Failed to get SmartThings access token: %s", err)
-        raise
-
-
-async def send_cleaning_type_command(
-    hass,
-    smartthings_entry_id: str,
-    device_id: str,
-    cleaning_type: str,
-):
-    """Send a cleaning type command to SmartThings using OAuth token (original method restored)."""
-    try:
-        access_token = await get_smartthings_access_token(hass, smartthings_entry_id)
-        session = async_get_clientsession(hass)
-        url = f"{SMARTTHINGS_BASE_URL}/{device_id}/commands"
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-            "Accept": "application/vnd.smartthings+json;v=1",
-        }
-        payload = {
-            "commands": [
-                {
-                    "component": "main",
-                    "capability": "samsungce.robotCleanerCleaningType",
-                    "command": "setCleaningType",
-                    "arguments": [cleaning_type],
-                }
-            ]
-        }
-        resp = await session.post(url, json=payload, headers=headers)
-        resp.raise_for_status()
-        await resp.release()
-        _LOGGER.debug("Successfully sent cleaning type command %s to device %s", cleaning_type, device_id)
-        
-    except Exception as err:
-        _LOGGER.error("Failed to send cleaning type command %s to device %s: %s", cleaning_type, device_id, err)
-        raise
-
-
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up select platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
@@ -115,17 +48,10 @@ class JetBotCleaningTypeSelect(CoordinatorEntity, SelectEntity):
             raw_options = supported_types["value"]
         else:
             # Fallback to common Combo AI cleaning types
-            raw_options = ["vacuum", "mop", "vacuumAndMopTogether", "mopAfterVacuum"]
+            raw_options = list(CLEANING_TYPES)
 
         # Create user-friendly names
-        friendly_names = {
-            "vacuum": "Vacuum Only",
-            "mop": "Mop Only",
-            "vacuumAndMopTogether": "Vacuum & Mop Together",
-            "mopAfterVacuum": "Vacuum Then Mop",
-        }
-
-        return [friendly_names.get(option, option) for option in raw_options]
+        return [CLEANING_TYPES.get(option, option) for option in raw_options]
 
     @property
     def current_option(self) -> str | None:
@@ -139,14 +65,7 @@ class JetBotCleaningTypeSelect(CoordinatorEntity, SelectEntity):
             raw_value = cleaning_type["value"]
 
             # Convert to friendly name
-            friendly_names = {
-                "vacuum": "Vacuum Only",
-                "mop": "Mop Only",
-                "vacuumAndMopTogether": "Vacuum & Mop Together",
-                "mopAfterVacuum": "Vacuum Then Mop",
-            }
-
-            return friendly_names.get(raw_value, raw_value)
+            return CLEANING_TYPES.get(raw_value, raw_value)
         return None
 
     @property
@@ -163,13 +82,7 @@ class JetBotCleaningTypeSelect(CoordinatorEntity, SelectEntity):
 
     def _friendly_to_raw(self, friendly_name: str) -> str:
         """Convert friendly name back to raw API value."""
-        name_mapping = {
-            "Vacuum Only": "vacuum",
-            "Mop Only": "mop",
-            "Vacuum & Mop Together": "vacuumAndMopTogether",
-            "Vacuum Then Mop": "mopAfterVacuum",
-        }
-        return name_mapping.get(friendly_name, friendly_name)
+        return CLEANING_TYPES_BY_NAME.get(friendly_name, friendly_name)
 
     async def async_select_option(self, option: str) -> None:
         """Set the cleaning type."""
@@ -178,7 +91,9 @@ class JetBotCleaningTypeSelect(CoordinatorEntity, SelectEntity):
         # Convert friendly name back to raw API value
         raw_option = self._friendly_to_raw(option)
 
-        await send_cleaning_type_command(
-            self.hass, self._smartthings_entry_id, self._device_id, raw_option
-        )
-        await self.coordinator.async_request_refresh()
\ No newline at end of file
+        if await self.coordinator.commands.async_send(
+            "setCleaningType",
+            capability="samsungce.robotCleanerCleaningType",
+            arguments=[raw_option],
+        ):
+            await self.coordinator.async_request_refresh()
\ No newline at end of file
@@ -1,195 +1,41 @@
 """Sensor platform for Samsung Jet Bot using OAuth tokens (original method restored)."""
 
 import logging
-from datetime import timedelta
-
-from homeassistant.components.sensor import SensorEntity
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-    UpdateFailed,
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
 )
+from homeassistant.const import EntityCategory
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, SMARTTHINGS_BASE_URL
+from .const import DOMAIN
+from .consumables import CONSUMABLES, Consumable
+from .coordinator import JetBotDataUpdateCoordinator
+from .descriptors import ATTRIBUTES, JetBotAttribute, attribute_value
 
 _LOGGER = logging.getLogger(__name__)
 
 
-async def get_smartthings_access_token(hass, smartthings_entry_id):
-    """Get the access token from the SmartThings integration."""
-    try:
-        # Get the SmartThings integration entry
-        smartthings_entry = hass.config_entries.async_get_entry(smartthings_entry_id)
-        if not smartthings_entry:
-            raise Exception("SmartThings entry not found")
-        
-        # Get the OAuth session from the SmartThings integration
-        if "smartthings" in hass.data and smartthings_entry_id in hass.data["smartthings"]:
-            smartthings_data = hass.data["smartthings"][smartthings_entry_id]
-            
-            # Try different ways to get the token depending on the integration structure
-            if hasattr(smartthings_data, 'api') and hasattr(smartthings_data.api, '_token'):
-                return smartthings_data.api._token
-            elif 'token' in smartthings_data:
-                return smartthings_data['token']
-            elif hasattr(smartthings_data, 'token'):
-                return smartthings_data.token
-        
-        # Fallback: try to get token from the entry data
-        if 'token' in smartthings_entry.data:
-            return smartthings_entry.data['token']['access_token']
-            
-        raise Exception("Could not extract access token from SmartThings integration")
-        
-    except Exception as err:
-        _LOGGER.error("Failed to get SmartThings access token: %s", err)
-        raise
-
-
-class JetBotDataUpdateCoordinator(DataUpdateCoordinator):
-    """Coordinator to fetch SmartThings device data using OAuth tokens (original method restored)."""
-
-    def __init__(self, hass, device_id: str, smartthings_entry_id: str):
-        super().__init__(
-            hass,
-            _LOGGER,
-            name=f"{DOMAIN}_{device_id}",
-            update_interval=timedelta(seconds=30),
-        )
-        self._device_id = device_id
-        self._smartthings_entry_id = smartthings_entry_id
-
-    async def _async_update_data(self):
-        """Fetch latest status and device detail from SmartThings (original method restored)."""
-        try:
-            access_token = await get_smartthings_access_token(self.hass, self._smartthings_entry_id)
-            session = async_get_clientsession(self.hass)
-            headers = {"Authorization": f"Bearer {access_token}"}
-
-            # 1) Get device status (all components/attributes)
-            status_url = f"{SMARTTHINGS_BASE_URL}/{self._device_id}/status"
-            resp = await session.get(status_url, headers=headers)
-            resp.raise_for_status()
-            status_json = await resp.json()
-            await resp.release()
-
-            # 2) Get device details (for the label)
-            detail_url = f"{SMARTTHINGS_BASE_URL}/{self._device_id}"
-            resp = await session.get(detail_url, headers=headers)
-            resp.raise_for_status()
-            detail_json = await resp.json()
-            await resp.release()
-
-            return {
-                "components": status_json.get("components", {}),
-                "label": detail_json.get("label"),
-            }
-            
-        except Exception as err:
-            _LOGGER.error("Error updating data for device %s: %s", self._device_id, err)
-            raise UpdateFailed(f"Error communicating with SmartThings API: {err}") from err
-
-
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up sensors for Samsung Jet Bot."""
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
     device_id = entry.data["device_id"]
 
     sensors = [
-        JetBotSensor(
-            coordinator,
-            device_id,
-            key="battery",
-            name="Jet Bot Battery",
-            capability="battery",
-            value_key="battery",
-            component="main",
-            unit_of_measurement="%",
-            icon="mdi:battery",
-        ),
-        JetBotSensor(
-            coordinator,
-            device_id,
-            key="mode",
-            name="Cleaning Mode",
-            capability="samsungce.robotCleanerCleaningMode",
-            value_key="robotCleanerCleaningMode",
-            component="main",
-        ),
-        JetBotSensor(
-            coordinator,
-            device_id,
-            key="state",
-            name="Operating State",
-            capability="samsungce.robotCleanerOperatingState",
-            value_key="operatingState",
-            component="main",
-        ),
-        JetBotSensor(
-            coordinator,
-            device_id,
-            key="step",
-            name="Cleaning Step",
-            capability="samsungce.robotCleanerOperatingState",
-            value_key="cleaningStep",
-            component="main",
-        ),
-        JetBotSensor(
-            coordinator,
-            device_id,
-            key="dustbin",
-            name="Dustbin Status",
-            capability="samsungce.robotCleanerDustBag",
-            value_key="status",
-            component="station",
-        ),
-        JetBotSensor(
-            coordinator,
-            device_id,
-            key="spray",
-            name="Water Spray Level",
-            capability="samsungce.robotCleanerWaterSprayLevel",
-            value_key="waterSprayLevel",
-            component="main",
-        ),
-        JetBotSensor(
-            coordinator,
-            device_id,
-            key="turbo",
-            name="Turbo Mode",
-            capability="samsungce.robotCleanerTurboMode",
-            value_key="robotCleanerTurboMode",
-            component="main",
-        ),
-        JetBotSensor(
-            coordinator,
-            device_id,
-            key="sound",
-            name="Sound Mode",
-            capability="samsungce.robotCleanerSystemSoundMode",
-            value_key="soundMode",
-            component="main",
-        ),
-        JetBotSensor(
-            coordinator,
-            device_id,
-            key="map_area",
-            name="Map Area",
-            capability="samsungce.robotCleanerMapCleaningInfo",
-            value_key="area",
-            component="main",
-        ),
-        JetBotSensor(
-            coordinator,
-            device_id,
-            key="extent",
-            name="Cleaned Extent",
-            capability="samsungce.robotCleanerMapCleaningInfo",
-            value_key="cleanedExtent",
-            component="main",
-        ),
+        JetBotSensor(coordinator, device_id, attribute) for attribute in ATTRIBUTES
+    ]
+    sensors += [
+        JetBotRoomsSensor(coordinator, device_id),
+        JetBotCoverageSensor(coordinator, device_id),
+        JetBotCommandQueueSensor(coordinator, device_id),
+        JetBotCommandWaitSensor(coordinator, device_id),
     ]
+    sensors.extend(
+        JetBotConsumableSensor(coordinator, device_id, consumable)
+        for consumable in CONSUMABLES
+    )
 
     async_add_entities(sensors, update_before_add=True)
 
@@ -201,35 +47,176 @@ class JetBotSensor(CoordinatorEntity, SensorEntity):
         self,
         coordinator: JetBotDataUpdateCoordinator,
         device_id: str,
-        key: str,
-        name: str,
-        capability: str,
-        value_key: str,
-        component: str,
-        unit_of_measurement: str | None = None,
-        icon: str | None = None,
+        attribute: JetBotAttribute,
     ):
         super().__init__(coordinator)
         self._device_id = device_id
-        self._key = key
-        self._capability = capability
-        self._value_key = value_key
-        self._component = component
+        self._attribute = attribute
 
-        self._attr_name = name
-        self._attr_unique_id = f"{DOMAIN}_{device_id}_{key}"
+        self._attr_name = attribute.name
+        self._attr_unique_id = f"{DOMAIN}_{device_id}_{attribute.key}"
 
-        if unit_of_measurement:
-            self._attr_native_unit_of_measurement = unit_of_measurement
-        if icon:
-            self._attr_icon = icon
+        if attribute.unit_of_measurement:
+            self._attr_native_unit_of_measurement = attribute.unit_of_measurement
+        if attribute.icon:
+            self._attr_icon = attribute.icon
 
     @property
     def native_value(self):
         """Extract the latest value from coordinator data."""
-        comps = self.coordinator.data.get("components", {})
-        cap = comps.get(self._component, {}).get(self._capability, {})
-        raw = cap.get(self._value_key)
-        if isinstance(raw, dict) and "value" in raw:
-            return raw["value"]
-        return raw
\ No newline at end of file
+        return attribute_value(self.coordinator.data, self._attribute)
+
+
+class JetBotRoomsSensor(CoordinatorEntity, SensorEntity):
+    """Number of rooms on the current map, with room names as attributes."""
+
+    def __init__(self, coordinator: JetBotDataUpdateCoordinator, device_id: str):
+        super().__init__(coordinator)
+        self._attr_name = "Rooms"
+        self._attr_unique_id = f"{DOMAIN}_{device_id}_rooms"
+        self._attr_icon = "mdi:floor-plan"
+
+    @property
+    def native_value(self):
+        """Return the room count from the cached map."""
+        jetbot_map = self.coordinator.maps.current
+        return len(jetbot_map.rooms) if jetbot_map else None
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Expose map name and rooms."""
+        jetbot_map = self.coordinator.maps.current
+        if not jetbot_map:
+            return {}
+        return {
+            "map_id": jetbot_map.map_id,
+            "map_name": jetbot_map.name,
+            "rooms": {room.room_id: room.name for room in jetbot_map.rooms},
+        }
+
+
+class JetBotCoverageSensor(CoordinatorEntity, SensorEntity):
+    """Share of the map covered during the last finished run."""
+
+    def __init__(self, coordinator: JetBotDataUpdateCoordinator, device_id: str):
+        super().__init__(coordinator)
+        self._attr_name = "Last Run Coverage"
+        self._attr_unique_id = f"{DOMAIN}_{device_id}_last_run_coverage"
+        self._attr_native_unit_of_measurement = "%"
+        self._attr_icon = "mdi:texture-box"
+
+    @property
+    def native_value(self):
+        """Return the coverage percentage from the cached map."""
+        jetbot_map = self.coordinator.maps.current
+        return jetbot_map.coverage if jetbot_map else None
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Expose the raw area figures of the last run."""
+        jetbot_map = self.coordinator.maps.current
+        if not jetbot_map or not jetbot_map.last_run_end:
+            return {}
+        return {
+            "area": jetbot_map.area,
+            "cleaned_extent": jetbot_map.cleaned_extent,
+        }
+
+
+class JetBotConsumableSensor(CoordinatorEntity, SensorEntity):
+    """Estimated remaining life of a consumable part."""
+
+    def __init__(
+        self,
+        coordinator: JetBotDataUpdateCoordinator,
+        device_id: str,
+        consumable: Consumable,
+    ):
+        super().__init__(coordinator)
+        self._consumable = consumable
+        self._attr_name = f"{consumable.name} Remaining"
+        self._attr_unique_id = f"{DOMAIN}_{device_id}_{consumable.key}_remaining"
+        self._attr_native_unit_of_measurement = "%"
+        self._attr_icon = consumable.icon
+
+    @property
+    def native_value(self):
+        """Return the remaining life percentage."""
+        return self.coordinator.consumables.remaining(self._consumable)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Expose hours used and rated life."""
+        return {
+            "hours_used": round(
+                self.coordinator.consumables.hours_used(self._consumable.key), 2
+            ),
+            "rated_hours": self._consumable.life_hours,
+        }
+
+
+class JetBotCommandMetricSensor(CoordinatorEntity, SensorEntity):
+    """Base for sensors reporting command executor metrics."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    async def async_added_to_hass(self) -> None:
+        """Also update when the executor's metrics change."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.commands.async_add_listener(self.async_write_ha_state)
+        )
+
+
+class JetBotCommandQueueSensor(JetBotCommandMetricSensor):
+    """Number of commands waiting or in flight for the device."""
+
+    def __init__(self, coordinator: JetBotDataUpdateCoordinator, device_id: str):
+        super().__init__(coordinator)
+        self._attr_name = "Command Queue Depth"
+        self._attr_unique_id = f"{DOMAIN}_{device_id}_command_queue_depth"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_icon = "mdi:tray-full"
+
+    @property
+    def native_value(self):
+        """Return the current queue depth."""
+        return self.coordinator.commands.queue_depth
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Expose command counters."""
+        commands = self.coordinator.commands
+        return {
+            "sent": commands.sent,
+            "superseded": commands.superseded,
+            "last_superseded": commands.last_superseded,
+            "timeouts": commands.timeouts,
+        }
+
+
+class JetBotCommandWaitSensor(JetBotCommandMetricSensor):
+    """Time the last command waited behind conflicting commands."""
+
+    def __init__(self, coordinator: JetBotDataUpdateCoordinator, device_id: str):
+        super().__init__(coordinator)
+        self._attr_name = "Command Wait Time"
+        self._attr_unique_id = f"{DOMAIN}_{device_id}_command_wait_time"
+        self._attr_device_class = SensorDeviceClass.DURATION
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_native_unit_of_measurement = "s"
+        self._attr_icon = "mdi:timer-sand"
+
+    @property
+    def native_value(self):
+        """Return the last wait time."""
+        return round(self.coordinator.commands.last_wait, 3)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Expose average and maximum wait times."""
+        commands = self.coordinator.commands
+        return {
+            "average_wait": round(commands.average_wait, 3),
+            "max_wait": round(commands.max_wait, 3),
+        }